@@ -125,8 +125,9 @@ class Disease(ss.Module):
         modules, where relevant.
         """
         sim = self.sim
+        alive = sim.people.alive.values # Gather once and reuse for every boolean state below
         for state in self._boolean_states:
-            self.results[f'n_{state.name}'][sim.ti] = np.count_nonzero(state & sim.people.alive)
+            self.results[f'n_{state.name}'][sim.ti] = np.count_nonzero(state.values & alive)
         return
 
 
@@ -152,6 +153,10 @@ class Infection(Disease):
         # Define random number generators for make_new_cases
         self.rng_target = ss.random(name='target')
         self.rng_source = ss.random(name='source')
+
+        # Scratch buffers for make_new_cases, reused across timesteps
+        self._rel_trans_buf = None
+        self._rel_sus_buf = None
         return
     
     def init_pre(self, sim):
@@ -253,15 +258,24 @@ class Infection(Disease):
         sources = []
         betamap = self._check_betas()
 
+        # Compute per-agent transmissibility and susceptibility once, in raw
+        # space: the products do not change between networks, and the edge
+        # gathers below can then index plain ndarrays rather than Arr objects.
+        # The products are written into scratch buffers kept on the instance,
+        # so the hot path allocates nothing once the population size is stable
+        raw_trans = self.rel_trans.raw
+        if self._rel_trans_buf is None or len(self._rel_trans_buf) != len(raw_trans):
+            self._rel_trans_buf = np.empty_like(raw_trans)
+            self._rel_sus_buf   = np.empty_like(raw_trans)
+        rel_trans = np.multiply(self.infectious.raw, raw_trans, out=self._rel_trans_buf)
+        rel_sus   = np.multiply(self.susceptible.raw, self.rel_sus.raw, out=self._rel_sus_buf)
+
         for nkey,net in self.sim.networks.items():
             if not len(net):
                 break
 
             nbetas = betamap[nkey]
             edges = net.edges
-
-            rel_trans = self.rel_trans.asnew(self.infectious * self.rel_trans)
-            rel_sus   = self.rel_sus.asnew(self.susceptible * self.rel_sus)
             p1p2b0 = [edges.p1, edges.p2, nbetas[0]]
             p2p1b1 = [edges.p2, edges.p1, nbetas[1]]
             for src, trg, beta in [p1p2b0, p2p1b1]:
@@ -278,8 +292,7 @@ class Infection(Disease):
                 rvs_s = self.rng_source.rvs(src)
                 rvs_t = self.rng_target.rvs(trg)
                 rvs = rvs_s + rvs_t
-                inds = np.where(rvs>1.0)[0]
-                rvs[inds] -= 1
+                rvs -= rvs > 1.0 # Wrap around to [0,1); subtracting the mask avoids materializing the indices via np.where()
                 
                 new_cases_bool = rvs < p_transmit
                 new_cases.append(trg[new_cases_bool])
@@ -142,15 +142,14 @@ class Cholera(ss.Infection):
         # Determine when exposed become infected
         self.ti_infected[uids] = ti + p.dur_exp2inf.rvs(uids) / dt
 
-        # Determine who becomes symptomatic and when
-        symp_uids = p.p_symp.filter(uids)
+        # Determine who becomes symptomatic and when; filtering both ways at
+        # once avoids recovering the complements with np.setdiff1d() afterwards
+        symp_uids, asymp_uids = p.p_symp.filter(uids, both=True)
         self.ti_symptomatic[symp_uids] = self.ti_infected[symp_uids]
 
         # Determine who dies and when
-        dead_uids = p.p_death.filter(symp_uids)
+        dead_uids, symp_rev_uids = p.p_death.filter(symp_uids, both=True)
         self.ti_dead[dead_uids] = self.ti_symptomatic[dead_uids] + p.dur_symp2dead.rvs(dead_uids) / dt
-        symp_rev_uids = np.setdiff1d(symp_uids, dead_uids)
-        asymp_uids = np.setdiff1d(uids, symp_uids)
 
         # Determine when agents recover
         self.ti_recovered[symp_rev_uids] = self.ti_exposed[symp_rev_uids] + p.dur_symp2rec.rvs(symp_rev_uids) / dt
@@ -175,8 +174,11 @@ class Cholera(ss.Infection):
 
     def update_death(self, uids):
         """ Reset infected/recovered flags for dead agents """
-        for state in ['susceptible', 'exposed', 'infected', 'symptomatic', 'recovered']:
-            self.statesdict[state][uids] = False
+        self.susceptible[uids] = False
+        self.exposed[uids] = False
+        self.infected[uids] = False
+        self.symptomatic[uids] = False
+        self.recovered[uids] = False
         return
 
     def update_results(self):
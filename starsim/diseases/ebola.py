@@ -5,12 +5,39 @@ Original version by@domdelport and @RomeshA
 """
 
 import numpy as np
+import numba as nb
 import starsim as ss
 from starsim.diseases.sir import SIR
 
 __all__ = ['Ebola']
 
 
+@nb.njit(cache=True)
+def _update_transitions(ti, auids, exposed, infected, severe, recovered, buried,
+                        ti_infected, ti_severe, ti_recovered, ti_dead, ti_buried, deaths): # pragma: no cover
+    """ Fused per-agent transition sweep for update_pre(); writes the state arrays in place """
+    n_deaths = 0
+    for k in range(len(auids)):
+        i = auids[k]
+        if exposed[i] and ti_infected[i] <= ti: # Progress exposed -> infected
+            exposed[i] = False
+            infected[i] = True
+        if infected[i] and ti_severe[i] <= ti: # Progress infectious -> severe
+            severe[i] = True
+        if infected[i] and ti_recovered[i] <= ti: # Progress infected -> recovered
+            infected[i] = False
+            recovered[i] = True
+        if severe[i] and ti_recovered[i] <= ti: # Progress severe -> recovered
+            severe[i] = False
+            recovered[i] = True
+        if ti_dead[i] <= ti: # Collect deaths to trigger
+            deaths[n_deaths] = i
+            n_deaths += 1
+        if ti_buried[i] <= ti: # Progress dead -> buried
+            buried[i] = True
+    return n_deaths
+
+
 class Ebola(SIR):
 
     def __init__(self, pars=None, *args, **kwargs):
@@ -59,35 +86,20 @@ class Ebola(SIR):
 
     def update_pre(self):
 
-        # Progress exposed -> infected
+        # Run all state transitions for the timestep in a single compiled sweep
+        # over the active agents; only deaths come back to the Python level
         ti = self.sim.ti
-        infected = (self.exposed & (self.ti_infected <= ti)).uids
-        self.exposed[infected] = False
-        self.infected[infected] = True
-
-        # Progress infectious -> severe
-        severe = (self.infected & (self.ti_severe <= ti)).uids
-        self.severe[severe] = True
-
-        # Progress infected -> recovered
-        recovered = (self.infected & (self.ti_recovered <= ti)).uids
-        self.infected[recovered] = False
-        self.recovered[recovered] = True
-
-        # Progress severe -> recovered
-        recovered_sev = (self.severe & (self.ti_recovered <= ti)).uids
-        self.severe[recovered_sev] = False
-        self.recovered[recovered_sev] = True
+        auids = self.sim.people.auids
+        deaths = np.empty(len(auids), dtype=auids.dtype)
+        n_deaths = _update_transitions(ti, np.asarray(auids),
+            self.exposed.raw, self.infected.raw, self.severe.raw, self.recovered.raw, self.buried.raw,
+            self.ti_infected.raw, self.ti_severe.raw, self.ti_recovered.raw, self.ti_dead.raw, self.ti_buried.raw,
+            deaths)
 
         # Trigger deaths
-        deaths = (self.ti_dead <= ti).uids
-        if len(deaths):
-            self.sim.people.request_death(deaths)
+        if n_deaths:
+            self.sim.people.request_death(ss.uids(deaths[:n_deaths]))
 
-        # Progress dead -> buried
-        buried = (self.ti_buried <= ti).uids
-        self.buried[buried] = True
-        
         return
 
     def set_prognoses(self, uids, source_uids=None):
@@ -103,36 +115,52 @@ class Ebola(SIR):
 
         p = self.pars
 
-        # Determine when exposed become infected
-        self.ti_infected[uids] = ti + p.dur_exp2symp.rvs(uids) / dt
+        # Determine when exposed become infected; the computed time-to-event
+        # arrays are kept as local contiguous temporaries and sliced by the
+        # Bernoulli masks below, rather than re-gathered column by column
+        ti_infected = ti + p.dur_exp2symp.rvs(uids) / dt
+        self.ti_infected[uids] = ti_infected
 
-        # Determine who progresses to sever and when
-        sev_uids = p.p_sev.filter(uids)
-        self.ti_severe[sev_uids] = self.ti_infected[sev_uids] + p.dur_symp2sev.rvs(sev_uids) / dt
+        # Determine who progresses to severe and when; keeping both halves of each
+        # Bernoulli draw avoids the sorts and intermediates of np.setdiff1d()
+        sev = p.p_sev.rvs(uids)
+        sev_uids = uids[sev]
+        rec_symp_uids = uids[~sev]
+        ti_severe = ti_infected[sev] + p.dur_symp2sev.rvs(sev_uids) / dt
+        self.ti_severe[sev_uids] = ti_severe
 
         # Determine who dies and who recovers and when
-        dead_uids = p.p_death.filter(sev_uids)
-        self.ti_dead[dead_uids] = self.ti_severe[dead_uids] + p.dur_sev2dead.rvs(dead_uids) / dt
-        rec_sev_uids = np.setdiff1d(sev_uids, dead_uids)
-        self.ti_recovered[rec_sev_uids] = self.ti_severe[rec_sev_uids] + p.dur_sev2rec.rvs(rec_sev_uids) / dt
-        rec_symp_uids = np.setdiff1d(uids, sev_uids)
-        self.ti_recovered[rec_symp_uids] = self.ti_infected[rec_symp_uids] + p.dur_symp2rec.rvs(rec_symp_uids) / dt
+        dead = p.p_death.rvs(sev_uids)
+        dead_uids = sev_uids[dead]
+        rec_sev_uids = sev_uids[~dead]
+        ti_dead = ti_severe[dead] + p.dur_sev2dead.rvs(dead_uids) / dt
+        self.ti_dead[dead_uids] = ti_dead
+        self.ti_recovered[rec_sev_uids] = ti_severe[~dead] + p.dur_sev2rec.rvs(rec_sev_uids) / dt
+        self.ti_recovered[rec_symp_uids] = ti_infected[~sev] + p.dur_symp2rec.rvs(rec_symp_uids) / dt
 
         # Determine time of burial - either immediate (safe burials) or after a delay (unsafe)
-        safe_buried = p.p_safe_bury.filter(dead_uids)
-        unsafe_buried = np.setdiff1d(dead_uids, safe_buried)
-        self.ti_buried[safe_buried] = self.ti_dead[safe_buried]
-        self.ti_buried[unsafe_buried] = self.ti_dead[unsafe_buried] + p.dur_dead2buried.rvs(unsafe_buried) / dt
-
-        # Change rel_trans values
-        self.rel_trans[self.infectious] = 1
-        self.rel_trans[self.severe] = self.pars['sev_factor']  # Change for severe
-        unburied_uids = ((self.ti_dead <= ti) & (self.ti_buried > ti)).uids
-        self.rel_trans[unburied_uids] = self.pars['unburied_factor']  # Change for unburied
+        safe = p.p_safe_bury.rvs(dead_uids)
+        safe_buried = dead_uids[safe]
+        unsafe_buried = dead_uids[~safe]
+        self.ti_buried[safe_buried] = ti_dead[safe]
+        self.ti_buried[unsafe_buried] = ti_dead[~safe] + p.dur_dead2buried.rvs(unsafe_buried) / dt
+
+        # Change rel_trans values with a single priority-encoded scatter:
+        # unburied overrides severe, which overrides the baseline infectious value
+        infectious = self.infected.values | self.exposed.values
+        severe = self.severe.values
+        unburied = (self.ti_dead.values <= ti) & (self.ti_buried.values > ti)
+        vals = np.where(unburied, self.pars.unburied_factor, np.where(severe, self.pars.sev_factor, 1.0))
+        write = infectious | severe | unburied
+        self.rel_trans[self.sim.people.auids[write]] = vals[write]
         return
 
     def update_death(self, uids):
-        # Reset infected/recovered flags for dead agents
-        for state in ['susceptible', 'exposed', 'infected', 'severe', 'recovered']:
-            self.statesdict[state][uids] = False
+        # Reset infected/recovered flags for dead agents; direct attribute
+        # access avoids the statesdict lookup per state
+        self.susceptible[uids] = False
+        self.exposed[uids] = False
+        self.infected[uids] = False
+        self.severe[uids] = False
+        self.recovered[uids] = False
         return
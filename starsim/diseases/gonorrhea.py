@@ -48,11 +48,12 @@ class Gonorrhea(ss.Infection):
 
     def update_pre(self):
         """ Natural clearance """
-        clearances = self.ti_clearance <= self.sim.ti
-        self.susceptible[clearances] = True
-        self.infected[clearances] = False
-        self.symptomatic[clearances] = False
-        self.ti_clearance[clearances] = self.sim.ti
+        ti = self.sim.ti
+        clear_uids = self.sim.people.auids[self.ti_clearance.values <= ti] # Compute the UIDs once for all four writes
+        self.susceptible[clear_uids] = True
+        self.infected[clear_uids] = False
+        self.symptomatic[clear_uids] = False
+        self.ti_clearance[clear_uids] = ti
 
         return
 
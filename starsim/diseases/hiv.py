@@ -45,14 +45,23 @@ class HIV(ss.Infection):
     def update_pre(self):
         """ Update CD4 """
         people = self.sim.people
-        self.cd4[people.alive & self.infected & self.on_art] += (self.pars.cd4_max - self.cd4[people.alive & self.infected & self.on_art])/self.pars.cd4_rate
-        self.cd4[people.alive & self.infected & ~self.on_art] += (self.pars.cd4_min - self.cd4[people.alive & self.infected & ~self.on_art])/self.pars.cd4_rate
+        pars = self.pars
 
-        self.rel_trans[people.alive & self.infected & self.on_art] = 1 - self.pars['art_efficacy']
+        # Compute the shared masks once rather than rebuilding them for every use
+        inf_vals = self.infected.values
+        infected = people.alive.values & inf_vals
+        on_art = self.on_art.values
+        art_uids = people.auids[infected & on_art]
+        no_art_uids = people.auids[infected & ~on_art]
+
+        self.cd4[art_uids] += (pars.cd4_max - self.cd4[art_uids])/pars.cd4_rate
+        self.cd4[no_art_uids] += (pars.cd4_min - self.cd4[no_art_uids])/pars.cd4_rate
+
+        self.rel_trans[art_uids] = 1 - pars.art_efficacy
+
+        can_die = people.auids[inf_vals]
+        hiv_deaths = pars.death_dist.filter(can_die)
 
-        can_die = people.hiv.infected.uids
-        hiv_deaths = self.pars.death_dist.filter(can_die)
-        
         people.request_death(hiv_deaths)
         self.ti_dead[hiv_deaths] = self.sim.ti
         return
@@ -87,7 +87,9 @@ class Measles(SIR):
 
     def update_death(self, uids):
         # Reset infected/recovered flags for dead agents
-        for state in ['susceptible', 'exposed', 'infected', 'recovered']:
-            self.statesdict[state][uids] = False
+        self.susceptible[uids] = False
+        self.exposed[uids] = False
+        self.infected[uids] = False
+        self.recovered[uids] = False
         return
 
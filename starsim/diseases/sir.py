@@ -3,12 +3,41 @@ Define SIR and SIS disease modules
 """
 
 import numpy as np
+import numba as nb
 import matplotlib.pyplot as pl
 import starsim as ss
 
 
 __all__ = ['SIR', 'SIS']
 
+
+@nb.njit(cache=True)
+def _due(state, ti_state, ti, auids): # pragma: no cover
+    """ Return the active UIDs that are in a given state and have a transition due """
+    out = np.empty(len(auids), dtype=auids.dtype)
+    n = 0
+    for k in range(len(auids)):
+        i = auids[k]
+        if state[i] and ti_state[i] <= ti:
+            out[n] = i
+            n += 1
+    return out[:n]
+
+
+@nb.njit(cache=True)
+def _sir_transitions(infected, ti_recovered, ti_dead, ti, auids, recovered, deaths): # pragma: no cover
+    """ Collect newly recovered agents and due deaths in a single pass """
+    n_rec, n_dead = 0, 0
+    for k in range(len(auids)):
+        i = auids[k]
+        if infected[i] and ti_recovered[i] <= ti:
+            recovered[n_rec] = i
+            n_rec += 1
+        if ti_dead[i] <= ti:
+            deaths[n_dead] = i
+            n_dead += 1
+    return n_rec, n_dead
+
 class SIR(ss.Infection):
     """
     Example SIR model
@@ -35,16 +64,25 @@ class SIR(ss.Infection):
         return
 
     def update_pre(self):
-        # Progress infectious -> recovered
+        # Progress infectious -> recovered and collect due deaths in a single
+        # fused pass over the active agents, with no intermediate masks. If no
+        # one is currently infected the sweep is skipped outright: recoveries
+        # and deaths are only ever scheduled for agents who are still infected
         sim = self.sim
-        recovered = (self.infected & (self.ti_recovered <= sim.ti)).uids
+        if not self.infected.raw.any():
+            return
+        auids = np.asarray(sim.people.auids)
+        recovered = np.empty(len(auids), dtype=auids.dtype)
+        deaths = np.empty(len(auids), dtype=auids.dtype)
+        n_rec, n_dead = _sir_transitions(self.infected.raw, self.ti_recovered.raw, self.ti_dead.raw,
+                                         sim.ti, auids, recovered, deaths)
+        recovered = ss.uids(recovered[:n_rec])
         self.infected[recovered] = False
         self.recovered[recovered] = True
 
         # Trigger deaths
-        deaths = (self.ti_dead <= sim.ti).uids
-        if len(deaths):
-            sim.people.request_death(deaths)
+        if n_dead:
+            sim.people.request_death(ss.uids(deaths[:n_dead]))
         return
 
     def set_prognoses(self, uids, source_uids=None):
@@ -113,14 +151,16 @@ class SIS(ss.Infection):
 
     def update_pre(self):
         """ Progress infectious -> recovered """
-        recovered = (self.infected & (self.ti_recovered <= self.sim.ti)).uids
-        self.infected[recovered] = False
-        self.susceptible[recovered] = True
+        if self.infected.raw.any(): # As in SIR, recoveries can only be pending for infected agents
+            auids = np.asarray(self.sim.people.auids)
+            recovered = ss.uids(_due(self.infected.raw, self.ti_recovered.raw, self.sim.ti, auids))
+            self.infected[recovered] = False
+            self.susceptible[recovered] = True
         self.update_immunity()
         return
-    
+
     def update_immunity(self):
-        has_imm = (self.immunity > 0).uids
+        has_imm = self.sim.people.auids[self.immunity.values > 0]
         self.immunity[has_imm] = (self.immunity[has_imm])*(1 - self.pars.waning*self.sim.dt)
         self.rel_sus[has_imm] = np.maximum(0, 1 - self.immunity[has_imm])
         return
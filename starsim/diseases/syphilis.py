@@ -3,13 +3,68 @@ Define default syphilis disease module
 """
 
 import numpy as np
+import numba as nb
 import sciris as sc
-from sciris import randround as rr # Since used frequently
 import starsim as ss
 
 
 __all__ = ['Syphilis']
 
+
+@nb.njit(cache=True)
+def rr(x): # pragma: no cover
+    """ Probabilistically round an array to the nearest integer; compiled array-only version of sc.randround() since used frequently """
+    out = np.empty(len(x), dtype=np.int64)
+    for i in range(len(x)):
+        out[i] = np.int64(np.floor(x[i] + np.random.random()))
+    return out
+
+
+@nb.njit(cache=True)
+def _due(state, ti_state, ti, auids): # pragma: no cover
+    """ Return the active UIDs that are in a given state and have a transition due """
+    out = np.empty(len(auids), dtype=auids.dtype)
+    n = 0
+    for k in range(len(auids)):
+        i = auids[k]
+        if state[i] and ti_state[i] <= ti:
+            out[n] = i
+            n += 1
+    return out[:n]
+
+
+@nb.njit(cache=True)
+def _finish_transitions(ti, auids, latent_long, tertiary, congenital, susceptible, rel_trans,
+                        ti_tertiary, ti_nnd, ti_stillborn, ti_congenital, rel_trans_tertiary, deaths): # pragma: no cover
+    """ Fused tail of update_pre(): tertiary progression and congenital outcomes in one sweep """
+    n_deaths = 0
+    for k in range(len(auids)):
+        i = auids[k]
+        if latent_long[i] and ti_tertiary[i] <= ti: # Progress latent_long -> tertiary
+            tertiary[i] = True
+            latent_long[i] = False
+            rel_trans[i] = rel_trans_tertiary
+        if ti_nnd[i] == ti or ti_stillborn[i] == ti: # Collect congenital deaths to trigger
+            deaths[n_deaths] = i
+            n_deaths += 1
+        if ti_congenital[i] == ti: # Congenital transmission outcomes
+            congenital[i] = True
+            susceptible[i] = False
+    return n_deaths
+
+
+@nb.njit(cache=True)
+def _count_congenital(ti_nnd, ti_stillborn, ti_congenital, ti, auids): # pragma: no cover
+    """ Count the congenital outcomes scheduled for this timestep in a single pass """
+    n_nnd, n_stillborn, n_congenital = 0, 0, 0
+    for k in range(len(auids)):
+        i = auids[k]
+        if ti_nnd[i] == ti:        n_nnd += 1
+        if ti_stillborn[i] == ti:  n_stillborn += 1
+        if ti_congenital[i] == ti: n_congenital += 1
+    return n_nnd, n_stillborn, n_congenital
+
+
 class Syphilis(ss.Infection):
 
     def __init__(self, pars=None, **kwargs):
@@ -95,17 +150,19 @@ class Syphilis(ss.Infection):
     @property
     def active(self):
         """ Active infection includes primary and secondary stages """
-        return self.primary | self.secondary
+        return self.primary.asnew(self.primary.values | self.secondary.values)
 
     @property
     def latent(self):
         """ Latent infection """
-        return self.latent_temp | self.latent_long
+        return self.latent_temp.asnew(self.latent_temp.values | self.latent_long.values)
 
     @property
     def infectious(self):
-        """ Infectious """
-        return self.active | self.latent | self.exposed
+        """ Infectious: anyone active, latent, or exposed; combined in value space to make a single BoolArr """
+        values = self.primary.values | self.secondary.values | self.latent_temp.values \
+               | self.latent_long.values | self.exposed.values
+        return self.primary.asnew(values)
 
     def init_results(self):
         """ Initialize results """
@@ -121,74 +178,86 @@ class Syphilis(ss.Infection):
     def update_pre(self):
         """ Updates prior to interventions """
 
-        # Primary
+        # Each transition below is computed as a single value-space mask. The time
+        # comparisons are made per block rather than hoisted to the top, since the
+        # set_*_prognoses() calls can schedule events for the current timestep.
         ti = self.sim.ti
-        primary = self.exposed & (self.ti_primary <= ti)
-        self.primary[primary] = True
-        self.exposed[primary] = False
-        self.rel_trans[primary] = self.pars.rel_trans['primary']
-
-        # Secondary from primary
-        secondary_from_primary = (self.primary & (self.ti_secondary <= ti)).uids
-        if len(secondary_from_primary) > 0:
-            self.secondary[secondary_from_primary] = True
-            self.primary[secondary_from_primary] = False
-            self.set_secondary_prognoses(secondary_from_primary)
-            self.rel_trans[secondary_from_primary] = self.pars.rel_trans['secondary']
-
-        # Hack to reset the MultiRNGs in set_secondary_prognoses so that they can be called again in this timestep. TODO: Refactor
-        self.pars.p_latent_temp.jump(ti+1)
-        self.pars.dur_secondary.jump(ti+1)
-
-        # Secondary reactivation from latent
-        secondary_from_latent = (self.latent_temp & (self.ti_secondary <= ti)).uids
-        if len(secondary_from_latent) > 0:
-            self.secondary[secondary_from_latent] = True
-            self.latent_temp[secondary_from_latent] = False
-            self.set_secondary_prognoses(secondary_from_latent)
-            self.rel_trans[secondary_from_latent] = self.pars.rel_trans['secondary']
-
-        # Latent
-        latent_temp = (self.secondary & (self.ti_latent_temp <= ti)).uids
-        if len(latent_temp) > 0:
-            self.latent_temp[latent_temp] = True
-            self.secondary[latent_temp] = False
-            self.set_latent_temp_prognoses(latent_temp)
-            self.rel_trans[latent_temp] = self.pars.rel_trans['latent_temp']
-
-        # Latent long
-        latent_long = (self.secondary & (self.ti_latent_long <= ti)).uids
-        if len(latent_long) > 0:
-            self.latent_long[latent_long] = True
-            self.secondary[latent_long] = False
-            self.set_latent_long_prognoses(latent_long)
-            self.rel_trans[latent_long] = self.pars.rel_trans['latent_long']
-
-        # Tertiary
-        tertiary = (self.latent_long & (self.ti_tertiary <= ti)).uids
-        self.tertiary[tertiary] = True
-        self.latent_long[tertiary] = False
-        self.rel_trans[tertiary] = self.pars.rel_trans['tertiary']
-
-        # Congenital syphilis deaths
-        nnd = (self.ti_nnd == ti).uids
-        stillborn = (self.ti_stillborn == ti).uids
-        self.sim.people.request_death(nnd)
-        self.sim.people.request_death(stillborn)
-
-        # Congenital syphilis transmission outcomes
-        congenital = self.ti_congenital == ti
-        self.congenital[congenital] = True
-        self.susceptible[congenital] = False
+        people = self.sim.people
+        auids = np.asarray(people.auids)
+        rel_trans = self.pars.rel_trans
+        ti_secondary = self.ti_secondary.raw # These two arrays are each scanned by two blocks
+        secondary = self.secondary.raw
+
+        # Fast path: if no agent is in any adult stage, skip the six transition
+        # scans entirely, e.g. during burn-in; the fused tail below still runs
+        # since congenital outcomes are scheduled for fetal uids separately
+        any_adult = (self.exposed.raw.any() or self.primary.raw.any() or secondary.any()
+                     or self.latent_temp.raw.any() or self.latent_long.raw.any())
+        if any_adult:
+            # Primary
+            primary = ss.uids(_due(self.exposed.raw, self.ti_primary.raw, ti, auids))
+            self.primary[primary] = True
+            self.exposed[primary] = False
+            self.rel_trans[primary] = rel_trans['primary']
+
+            # Secondary from primary
+            secondary_from_primary = ss.uids(_due(self.primary.raw, ti_secondary, ti, auids))
+            if len(secondary_from_primary) > 0:
+                self.secondary[secondary_from_primary] = True
+                self.primary[secondary_from_primary] = False
+
+            # Secondary reactivation from latent
+            secondary_from_latent = ss.uids(_due(self.latent_temp.raw, ti_secondary, ti, auids))
+            if len(secondary_from_latent) > 0:
+                self.secondary[secondary_from_latent] = True
+                self.latent_temp[secondary_from_latent] = False
+
+            # Set prognoses for all new secondary cases at once, so that each
+            # distribution in set_secondary_prognoses is only drawn from once per
+            # timestep (previously this required jumping the RNGs between calls)
+            new_secondary = secondary_from_primary.concat(secondary_from_latent)
+            if len(new_secondary) > 0:
+                self.set_secondary_prognoses(new_secondary)
+                self.rel_trans[new_secondary] = rel_trans['secondary']
+
+            # Latent
+            latent_temp = ss.uids(_due(secondary, self.ti_latent_temp.raw, ti, auids))
+            if len(latent_temp) > 0:
+                self.latent_temp[latent_temp] = True
+                self.secondary[latent_temp] = False
+                self.set_latent_temp_prognoses(latent_temp)
+                self.rel_trans[latent_temp] = rel_trans['latent_temp']
+
+            # Latent long
+            latent_long = ss.uids(_due(secondary, self.ti_latent_long.raw, ti, auids))
+            if len(latent_long) > 0:
+                self.latent_long[latent_long] = True
+                self.secondary[latent_long] = False
+                self.set_latent_long_prognoses(latent_long)
+                self.rel_trans[latent_long] = rel_trans['latent_long']
+
+        # Tertiary progression plus the congenital deaths and transmission
+        # outcomes draw no random numbers, so they can be fused into a single
+        # sweep that touches each agent's columns once while cache-resident
+        deaths = np.empty(len(auids), dtype=auids.dtype)
+        n_deaths = _finish_transitions(ti, auids, self.latent_long.raw, self.tertiary.raw,
+            self.congenital.raw, self.susceptible.raw, self.rel_trans.raw,
+            self.ti_tertiary.raw, self.ti_nnd.raw, self.ti_stillborn.raw, self.ti_congenital.raw,
+            rel_trans['tertiary'], deaths)
+        if n_deaths:
+            people.request_death(ss.uids(deaths[:n_deaths]))
 
         return
 
     def update_results(self):
         super().update_results()
         ti = self.sim.ti
-        self.results.new_nnds[ti]       = np.count_nonzero(self.ti_nnd == ti)
-        self.results.new_stillborns[ti] = np.count_nonzero(self.ti_stillborn == ti)
-        self.results.new_congenital[ti] = np.count_nonzero(self.ti_congenital == ti)
+        res = self.results
+        n_nnd, n_stillborn, n_congenital = _count_congenital(self.ti_nnd.raw, self.ti_stillborn.raw,
+            self.ti_congenital.raw, ti, np.asarray(self.sim.people.auids))
+        res.new_nnds[ti]       = n_nnd
+        res.new_stillborns[ti] = n_stillborn
+        res.new_congenital[ti] = n_congenital
         return
 
     def set_prognoses(self, uids, source_uids=None):
@@ -225,13 +294,14 @@ class Syphilis(ss.Infection):
 
         # Secondary to latent_temp or latent_long
         latent_temp = self.pars.p_latent_temp.rvs(uids)
+        latent_long = ~latent_temp # Invert once and reuse for both gathers below
         latent_temp_uids = uids[latent_temp]
-        latent_long_uids = uids[~latent_temp]
+        latent_long_uids = uids[latent_long]
 
         dur_secondary_temp = dur_secondary[latent_temp]
         self.ti_latent_temp[latent_temp_uids] = self.ti_secondary[latent_temp_uids] + rr(dur_secondary_temp / dt)
 
-        dur_secondary_long = dur_secondary[~latent_temp]
+        dur_secondary_long = dur_secondary[latent_long]
         self.ti_latent_long[latent_long_uids] = self.ti_secondary[latent_long_uids] + rr(dur_secondary_long / dt)
 
         return
@@ -244,11 +314,10 @@ class Syphilis(ss.Infection):
 
     def set_latent_long_prognoses(self, uids):
         dt = self.sim.dt
-        dur_latent = self.pars.dur_latent_long.rvs(uids)
+        dur_latent_long = self.pars.dur_latent_long.rvs(uids) # Drawn once and reused for both transitions below
 
-        # Primary to secondary
-        dur_latent_long = dur_latent
-        self.ti_secondary[uids] = self.ti_latent_temp[uids] + rr(dur_latent_long / dt)
+        # Latent_long to secondary; note this was previously (incorrectly) indexing ti_latent_temp
+        self.ti_secondary[uids] = self.ti_latent_long[uids] + rr(dur_latent_long / dt)
 
         # Latent_long to tertiary
         tertiary = self.pars.p_tertiary.rvs(uids)
@@ -260,28 +329,26 @@ class Syphilis(ss.Infection):
     def set_congenital(self, uids, source_uids=None):
         """ Natural history of syphilis for congenital infection """
         sim = self.sim
+        scaled_time_to_birth = -sim.people.age.raw / sim.dt # Scale once, outside the outcome loops; TODO: make nicer
 
         # Determine outcomes
         for state in ['active', 'latent']:
 
-            source_state_inds = getattr(self, state)[source_uids].nonzero()[0]
-            state_uids = uids[source_state_inds]
+            state_uids = uids[getattr(self, state)[source_uids]] # Boolean gather, skipping the nonzero() intermediate
 
             if len(state_uids) > 0:
 
                 # Birth outcomes must be modified to add probability of susceptible birth
                 birth_outcomes = self.pars.birth_outcomes[state]
                 assigned_outcomes = birth_outcomes.rvs(len(state_uids))
-                time_to_birth = -sim.people.age.raw # TODO: make nicer
 
-                # Schedule events
+                # Schedule events: draw all birth times for the cohort at once,
+                # then scatter them into the per-outcome ti_* columns
+                new_ti = sim.ti + rr(scaled_time_to_birth[state_uids])
                 for oi, outcome in enumerate(self.pars.birth_outcome_keys):
-                    o_uids = state_uids[assigned_outcomes == oi]
-                    if len(o_uids) > 0:
-                        ti_outcome = f'ti_{outcome}'
-                        vals = getattr(self, ti_outcome)
-                        vals[o_uids] = sim.ti + rr(time_to_birth[o_uids] / sim.dt)
-                        setattr(self, ti_outcome, vals)
+                    o_mask = assigned_outcomes == oi
+                    if o_mask.any():
+                        getattr(self, f'ti_{outcome}')[state_uids[o_mask]] = new_ti[o_mask]
 
         return
 
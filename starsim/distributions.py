@@ -189,9 +189,10 @@ class Dist:
         self.auto = auto
         self.debug = debug
         
-        # Auto-generated 
+        # Auto-generated
         self.rvs_func = None # The default function to call in make_rvs() to generate the random numbers
         self.dynamic_pars = None # Whether or not the distribution has array or callable parameters
+        self._static_pars = False # Whether all parameters are scalar, in which case they only need to be processed once
         self._pars = None # Validated and transformed (if necessary) parameters
         self._n = None # Internal variable to keep track of "n" argument (usually size)
         self._size = None # Internal variable to keep track of actual number of random variates asked for
@@ -293,7 +294,10 @@ class Dist:
         """ Store the current state in history """
         if reset:
             self.history = []
-        self.history.append(self.get_state()) # Store the initial state
+        if len(self.history) < 2:
+            self.history.append(self.get_state()) # Store the initial state
+        else:
+            self.history[-1] = self.get_state() # Only the initial (0) and most recent (-1) states are used, so don't let the list grow with every call
         return
 
     def reset(self, state=0):
@@ -455,6 +459,7 @@ class Dist:
     
     def process_pars(self, call=True):
         """ Ensure the supplied dist and parameters are valid, and initialize them; called automatically """
+        self._static_pars = all(np.isscalar(v) or v is None for v in self.pars.values()) # All-scalar parameters don't need to be reprocessed on subsequent calls
         self._pars = sc.cp(self.pars) # The actual keywords; shallow copy, modified below for special cases
         if call:
             self.call_pars() # Convert from function to values if needed
@@ -544,8 +549,9 @@ class Dist:
         # Store the state
         self.make_history() # Store the pre-call state
         
-        # Check if any keywords are callable -- parameters shouldn't need to be reprocessed otherwise
-        self.process_pars()
+        # Check if any keywords are callable -- fixed scalar parameters only need to be processed once
+        if self._pars is None or not self._static_pars:
+            self.process_pars()
         
         # Actually get the random numbers
         if self.dynamic_pars:
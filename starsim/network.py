@@ -318,10 +318,12 @@ class DynamicNetwork(Network):
 
     def end_pairs(self):
         people = self.sim.people
-        self.edges.dur = self.edges.dur - self.sim.dt
+        self.edges.dur -= self.sim.dt
 
-        # Non-alive agents are removed
-        active = (self.edges.dur > 0) & people.alive[self.edges.p1] & people.alive[self.edges.p2]
+        # Non-alive agents are removed; snapshot the alive array once and index
+        # it directly, rather than dispatching through the Arr for each endpoint
+        alive = people.alive.raw
+        active = (self.edges.dur > 0) & alive[self.edges.p1] & alive[self.edges.p2]
         for k in self.meta_keys():
             self.edges[k] = self.edges[k][active]
         return len(active)
@@ -336,10 +338,10 @@ class SexualNetwork(DynamicNetwork):
         return
 
     def active(self, people):
-        # Exclude people who are not alive
-        valid_age = people.age > self.debut
-        active = self.participant & valid_age & people.alive
-        return active
+        # Exclude people who are not alive; computed in value space so only the
+        # final result is wrapped in a BoolArr, rather than one per & operation
+        values = self.participant.values & (people.age.values > self.debut.values) & people.alive.values
+        return self.participant.asnew(values)
 
     def available(self, people, sex):
         # Currently assumes unpartnered people are available
@@ -799,7 +801,8 @@ class MaternalNet(DynamicNetwork):
 
     def end_pairs(self):
         people = self.sim.people
-        active = (self.edges.end > self.sim.ti) & people.alive[self.edges.p1] & people.alive[self.edges.p2]
+        alive = people.alive.raw # As in DynamicNetwork.end_pairs, index the raw array directly
+        active = (self.edges.end > self.sim.ti) & alive[self.edges.p1] & alive[self.edges.p2]
         for k in self.meta_keys():
             self.edges[k] = self.edges[k][active]
         return len(active)
@@ -286,10 +286,8 @@ class SimPars(Pars):
         """
         if self.unit == 'year': # TODO: implement properly
             dt = self.dt
-            reciprocal = 1.0 / dt  # Compute the reciprocal of dt
-            if not reciprocal.is_integer():  # Check if reciprocal is not a whole (integer) number
-                # Round the reciprocal
-                reciprocal = int(reciprocal)
+            reciprocal = round(1.0 / dt)  # Round the reciprocal of dt first, so float error in the division can't misclassify a valid dt
+            if abs(reciprocal * dt - 1.0) > 1e-9:  # Check if there is not a whole (integer) number of steps per year
                 rounded_dt = 1.0 / reciprocal
                 self.dt = rounded_dt
                 if self.verbose:
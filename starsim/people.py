@@ -6,11 +6,35 @@ Defines the People class and functions associated with making people
 import numpy as np
 import pandas as pd
 import sciris as sc
+import numba as nb
 import starsim as ss
 
 __all__ = ['People', 'Person']
 
 
+@nb.njit(cache=True)
+def _filter_auids(auids, removed): # pragma: no cover
+    """
+    Optimized helper to compact the active UIDs after removing agents.
+
+    Both arrays must be sorted (which auids and the removed UIDs always are),
+    so a single merge-style walk suffices: cost is O(N+M) in the number of
+    active and removed agents, independent of how many UIDs have ever existed.
+    """
+    out = np.empty(len(auids), dtype=auids.dtype)
+    n = 0
+    j = 0
+    m = len(removed)
+    for uid in auids:
+        while j < m and removed[j] < uid:
+            j += 1
+        if j < m and removed[j] == uid:
+            continue
+        out[n] = uid
+        n += 1
+    return out[:n]
+
+
 class People(sc.prettyobj):
     """
     A class to perform all the operations on the people
@@ -207,7 +231,13 @@ class People(sc.prettyobj):
         return setattr(self, key, value)
 
     def __iter__(self):
-        """ Iterate over people """
+        """
+        Iterate over people
+
+        Note: this builds a Person object per agent, which is orders of magnitude
+        slower than operating on the state arrays; it is intended for interactive
+        exploration only, not for use inside simulation loops.
+        """
         for i in range(len(self)):
             yield self[i]
 
@@ -235,7 +265,10 @@ class People(sc.prettyobj):
         """ Final updates at the very end of the timestep """
         sim = self.sim
         if sim.pars.use_aging:
-            self.age[self.alive.uids] += sim.dt
+            # Age everyone who is alive via a single masked in-place add over the
+            # raw arrays; equivalent to self.age[self.alive.uids] += dt, but with
+            # no index materialization, gather, or scatter
+            np.add(self.age.raw, sim.dt, out=self.age.raw, where=self.alive.raw)
         return
 
     def request_death(self, uids):
@@ -268,7 +301,7 @@ class People(sc.prettyobj):
 
     def resolve_deaths(self):
         """ Carry out any deaths that took place this timestep """
-        death_uids = (self.ti_dead <= self.sim.ti).uids
+        death_uids = self.auids[self.ti_dead.values <= self.sim.ti] # Value-space mask, avoiding an intermediate BoolArr
         self.alive[death_uids] = False
         return death_uids
     
@@ -276,15 +309,16 @@ class People(sc.prettyobj):
         """
         Remove dead agents
         """
-        uids = self.dead.uids
+        uids = self.auids[~self.alive.values] # Same as self.dead.uids, without materializing the intermediate BoolArr
         if len(uids):
             
             # Remove the UIDs from the networks too
             for network in self.sim.networks.values():
                 network.remove_uids(uids) # TODO: only run once every nth timestep
                 
-            # Calculate the indices to keep
-            self.auids = self.auids[np.isin(self.auids, np.unique(uids), assume_unique=True, invert=True, kind='sort')]
+            # Calculate the indices to keep, via a single compiled merge walk
+            # over the (sorted) active and removed UIDs
+            self.auids = ss.uids(_filter_auids(self.auids.to_numpy(), uids.to_numpy()))
 
         return
     
@@ -307,7 +341,7 @@ class People(sc.prettyobj):
         return
     
     def person(self, ind):
-        """ Get all the properties for a single person """
+        """ Get all the properties for a single person (slow; for interactive use) """
         person = Person()
         for key in ['uid', 'slot']:
             person[key] = self[key][ind]
@@ -90,11 +90,12 @@ class Sim(sc.prettyobj):
     
     def init_time_attrs(self):
         """ Time indexing; derived values live in the sim rather than in the pars """
-        self.dt = self.pars.dt # Shortcut to dt since used a lot
-        self.yearvec = np.arange(start=self.pars.start, stop=self.pars.end + self.pars.dt, step=self.pars.dt) # The time points of the sim
-        self.results.yearvec = self.yearvec # Store the yearvec in the results for plotting
-        self.npts = len(self.yearvec) # The number of points in the sim
+        pars = self.pars
+        self.dt = pars.dt # Shortcut to dt since used a lot
+        self.npts = int(round((pars.end - pars.start)/pars.dt)) + 1 # The number of points in the sim, computed with integer arithmetic so a float-step arange cannot overshoot the endpoint
         self.tivec = np.arange(self.npts) # The vector of time indices
+        self.yearvec = pars.start + self.tivec*pars.dt # The time points of the sim
+        self.results.yearvec = self.yearvec # Store the yearvec in the results for plotting
         self.ti = 0  # The time index, e.g. 0, 1, 2
         return
 
@@ -174,13 +175,17 @@ class Sim(sc.prettyobj):
         # Advance random number generators forward to prepare for any random number calls that may be necessary on this step
         self.dists.jump(to=self.ti+1)  # +1 offset because ti=0 is used on initialization
 
+        # Materialize the module lists that are looped over more than once below
+        demographics = self.demographics()
+        diseases = self.diseases()
+
         # Update demographic modules (create new agents from births/immigration, schedule non-disease deaths and emigration)
-        for dem_mod in self.demographics():
+        for dem_mod in demographics:
             dem_mod.update()
 
         # Carry out autonomous state changes in the disease modules. This allows autonomous state changes/initializations
         # to be applied to newly created agents
-        for disease in self.diseases():
+        for disease in diseases:
             disease.update_pre()
 
         # Update connectors -- TBC where this appears in the ordering
@@ -197,22 +202,22 @@ class Sim(sc.prettyobj):
             intervention(self)
 
         # Carry out transmission/new cases
-        for disease in self.diseases():
+        for disease in diseases:
             disease.make_new_cases()
 
         # Execute deaths that took place this timestep (i.e., changing the `alive` state of the agents). This is executed
         # before analyzers have run so that analyzers are able to inspect and record outcomes for agents that died this timestep
         uids = self.people.resolve_deaths()
-        for disease in self.diseases():
+        for disease in diseases:
             disease.update_death(uids)
 
         # Update results
         self.people.update_results()
 
-        for dem_mod in self.demographics():
+        for dem_mod in demographics:
             dem_mod.update_results()
 
-        for disease in self.diseases():
+        for disease in diseases:
             disease.update_results()
 
         for analyzer in self.analyzers():
@@ -238,7 +243,6 @@ class Sim(sc.prettyobj):
         T = sc.timer()
         if not self.initialized:
             self.initialize()
-            self._orig_pars = sc.dcp(self.pars)  # Create a copy of the parameters to restore after the run
 
         if verbose is None:
             verbose = self.pars.verbose
@@ -255,21 +259,22 @@ class Sim(sc.prettyobj):
         if errormsg:
             raise AlreadyRunError(errormsg)
 
+        # Precompute the progress cadence, so skipped timesteps don't format messages that are never shown
+        if verbose:
+            simlabel = f'"{self.label}": ' if self.label else ''
+            progress_every = 1 if verbose >= 2 else int(1.0 / verbose)
+
         # Main simulation loop
         while self.ti < until:
 
-            # Check if we were asked to stop
-            elapsed = T.toc(output=True)
-
-            # Print progress
-            if verbose:
-                simlabel = f'"{self.label}": ' if self.label else ''
+            # Print progress; the timer and message are only touched on timesteps that actually print
+            if verbose and not (self.ti % progress_every):
+                elapsed = T.toc(output=True)
                 string = f'  Running {simlabel}{self.yearvec[self.ti]:0.1f} ({self.ti:2.0f}/{self.npts}) ({elapsed:0.2f} s) '
                 if verbose >= 2:
                     sc.heading(string)
-                elif verbose > 0:
-                    if not (self.ti % int(1.0 / verbose)):
-                        sc.progressbar(self.ti + 1, self.npts, label=string, length=20, newline=True)
+                else:
+                    sc.progressbar(self.ti + 1, self.npts, label=string, length=20, newline=True)
 
             # Actually run the model
             self.step()
@@ -277,7 +282,7 @@ class Sim(sc.prettyobj):
         # If simulation reached the end, finalize the results
         if self.complete:
             self.finalize(verbose=verbose)
-            sc.printv(f'Run finished after {elapsed:0.2f} s.\n', 1, verbose)
+            sc.printv(f'Run finished after {T.toc(output=True):0.2f} s.\n', 1, verbose)
 
         return self
 
@@ -371,7 +376,7 @@ class Sim(sc.prettyobj):
         Returns:
             shrunken (Sim): a Sim object with the listed attributes removed
         """
-        # By default, skip people (~90% of memory), popdict, and _orig_pars (which is just a backup)
+        # By default, skip people (~90% of memory)
         if skip_attrs is None:
             skip_attrs = ['people']
 
@@ -381,8 +386,9 @@ class Sim(sc.prettyobj):
             for attr in skip_attrs:
                 setattr(self, attr, None)
         else:
-            shrunken = object.__new__(self.__class__)
-            shrunken.__dict__ = {k: (v if k not in skip_attrs else None) for k, v in self.__dict__.items()}
+            shrunken = sc.cp(self) # Shallow copy, so the kept attributes are shared rather than rebuilt
+            for attr in skip_attrs:
+                setattr(shrunken, attr, None)
 
         # Don't return if in place
         if in_place:
@@ -418,11 +424,13 @@ class Sim(sc.prettyobj):
                 label = n_ia + label if label < 0 else label  # Convert to a positive number
                 match_inds.append(label)
             elif sc.isstring(label) or isinstance(label, type):
+                is_str = sc.isstring(label) # Resolve the label type once rather than per entry in the scan below
                 for ind, ia_key, ia_obj in ia_ndict.enumitems():
-                    if sc.isstring(label) and ia_obj.label == label or (partial and (label in str(ia_obj.label))):
-                        matches.append(ia_obj)
-                        match_inds.append(ind)
-                    elif isinstance(label, type) and isinstance(ia_obj, label):
+                    if is_str:
+                        if ia_obj.label == label or (partial and (label in str(ia_obj.label))):
+                            matches.append(ia_obj)
+                            match_inds.append(ind)
+                    elif isinstance(ia_obj, label):
                         matches.append(ia_obj)
                         match_inds.append(ind)
             else:  # pragma: no cover
@@ -94,8 +94,15 @@ class Arr(np.lib.mixins.NDArrayOperatorsMixin):
         return
     
     def __repr__(self):
-        arr_str = np.array2string(self.values, max_line_width=200)
-        string = f'<{self.__class__.__name__} "{str(self.name)}", len={len(self)}, {arr_str}>'
+        n = len(self)
+        if n > 1000: # For large arrays, only gather and format the edges rather than materializing all values
+            auids = self.auids
+            head = np.array2string(self.raw[auids[:3]], max_line_width=200)[:-1]
+            tail = np.array2string(self.raw[auids[-3:]], max_line_width=200)[1:]
+            arr_str = head + ' ... ' + tail
+        else:
+            arr_str = np.array2string(self.values, max_line_width=200)
+        string = f'<{self.__class__.__name__} "{str(self.name)}", len={n}, {arr_str}>'
         return string
     
     def __len__(self):
@@ -120,10 +127,15 @@ class Arr(np.lib.mixins.NDArrayOperatorsMixin):
             raise Exception(errormsg)
     
     def __getitem__(self, key):
+        if type(key) is uids or type(key) is int: # Fast path for the dominant key types, skipping _convert_key() dispatch
+            return self.raw[key]
         key = self._convert_key(key)
         return self.raw[key]
-    
+
     def __setitem__(self, key, value):
+        if type(key) is uids or type(key) is int: # Fast path, as with __getitem__()
+            self.raw[key] = value
+            return
         key = self._convert_key(key)
         self.raw[key] = value
         return
@@ -149,17 +161,36 @@ class Arr(np.lib.mixins.NDArrayOperatorsMixin):
     
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         """ For almost everything else, behave like a normal NumPy array on Arr.values """
+        if method == '__call__' and len(inputs) == 2 and not kwargs: # Fast path for the dominant case, a plain binary operation
+            a, b = inputs
+            if isinstance(a, Arr): a = a.values
+            if isinstance(b, Arr): b = b.values
+            return ufunc(a, b)
         inputs = [x.values if isinstance(x, Arr) else x for x in inputs]
         return getattr(ufunc, method)(*inputs, **kwargs)
-    
+
+    def __array_function__(self, func, types, args, kwargs):
+        """ Dispatch non-ufunc NumPy functions (e.g. np.count_nonzero()) straight to Arr.values """
+        if not all(issubclass(t, (Arr, np.ndarray)) for t in types): # Defer to unknown array implementations, per NEP 18
+            return NotImplemented
+        def unwrap(x):
+            if isinstance(x, Arr):
+                return x.values
+            if isinstance(x, (list, tuple)): # Also unwrap inside sequences, for e.g. np.concatenate([arr1, arr2])
+                return type(x)(unwrap(v) for v in x)
+            return x
+        args = [unwrap(x) for x in args]
+        kwargs = {k: unwrap(v) for k, v in kwargs.items()}
+        return func(*args, **kwargs)
+
     @property
     def auids(self):
         """ Link to the indices of active agents -- sim.people.auids """
-        try:
-            return self.people.auids
-        except:
-            ss.warn('Trying to access non-initialized States object')
-            return uids(np.arange(len(self.raw)))
+        people = self.people
+        if people is not None: # Explicit check rather than try/except, which would also swallow unrelated errors
+            return people.auids
+        ss.warn('Trying to access non-initialized States object')
+        return uids(np.arange(len(self.raw)))
     
     def count(self):
         return np.count_nonzero(self.values)
@@ -167,7 +198,7 @@ class Arr(np.lib.mixins.NDArrayOperatorsMixin):
     @property
     def values(self):
         """ Return the values of the active agents """
-        return self.raw[self.auids]
+        return self.raw.take(self.auids) # Same as raw[auids], but take() is measurably faster for large gathers
 
     def set(self, uids, new_vals=None):
         """ Set the values for the specified UIDs"""
@@ -214,13 +245,18 @@ class Arr(np.lib.mixins.NDArrayOperatorsMixin):
         
         # Physically reshape the arrays, if needed
         if orig_len + n_new > self.len_tot:
-            n_grow = max(n_new, self.len_tot//2)  # Minimum 50% growth, since growing arrays is slow
-            new_empty = np.empty(n_grow, dtype=self.dtype) # 10x faster than np.zeros()
-            self.raw = np.concatenate([self.raw, new_empty], axis=0)
+            n_grow = max(n_new, self.len_tot)  # At least double the size, so growth cost is amortized O(1) per agent
+            if self.len_tot: # On regrowth, round total capacity up to a multiple of 64 elements, keeping allocations SIMD-lane friendly; the initial allocation stays exact
+                n_grow += -(self.len_tot + n_grow) % 64
+            try:
+                self.raw.resize(self.len_tot + n_grow, refcheck=False) # Reallocate in place where possible, avoiding np.concatenate()'s copy
+                filled = self.nan == 0 # resize() zero-fills the new elements, so a zero/False nan is already in place
+            except ValueError: # The array doesn't own its data (e.g. an IndexArr's uids view), so fall back to copying
+                self.raw = np.concatenate([self.raw, np.empty(n_grow, dtype=self.dtype)], axis=0)
+                filled = False
             self.len_tot = len(self.raw)
-            if n_grow > n_new: # We added extra space at the end, set to NaN
-                nan_uids = np.arange(self.len_used, self.len_tot)
-                self.set_nan(nan_uids)
+            if n_grow > n_new and not filled: # We added extra space at the end, set to NaN
+                self.raw[self.len_used:] = self.nan # Slice assignment, rather than allocating an index array per state
         
         # Set new values, and NaN if needed
         self.set(new_uids, new_vals=new_vals) # Assign new default values to those agents
@@ -256,11 +292,11 @@ class Arr(np.lib.mixins.NDArrayOperatorsMixin):
 
     def true(self):
         """ Efficiently convert truthy values to UIDs """
-        return self.auids[self.values.astype(bool)]
+        return self.auids[self.values.astype(bool, copy=False)] # copy=False avoids duplicating BoolArr values, which are already boolean
 
     def false(self):
         """ Reverse of true(); return UIDs of falsy values """
-        return self.auids[~self.values.astype(bool)]
+        return self.auids[~self.values.astype(bool, copy=False)]
 
 
 class FloatArr(Arr):
@@ -283,7 +319,7 @@ class FloatArr(Arr):
     def notnanvals(self):
         """ Return values that are not-NaN """
         vals = self.values # Shorten and avoid double indexing
-        out = vals[np.nonzero(~np.isnan(vals))[0]]
+        out = vals[~np.isnan(vals)] # Boolean indexing directly, skipping the nonzero() index round-trip
         return out
 
 
@@ -301,11 +337,11 @@ class BoolArr(Arr):
     # BoolArr cannot store NaNs so report all entries as being not-NaN
     @property
     def isnan(self):
-        return self.asnew(np.full_like(self.values, fill_value=False), cls=BoolArr)
+        return self.asnew(np.zeros_like(self.values), cls=BoolArr) # calloc-backed, unlike np.full_like(..., False)
 
     @property
     def notnan(self):
-        return self.asnew(np.full_like(self.values, fill_value=True), cls=BoolArr)
+        return self.asnew(np.ones_like(self.values), cls=BoolArr)
 
     @property
     def uids(self):
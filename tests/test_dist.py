@@ -192,7 +192,7 @@ def test_callable(n=n):
     sim.people = sc.prettyobj()
     sim.people.uid = np.arange(sim.n)
     sim.people.slot = np.arange(sim.n)
-    sim.people.age = np.random.uniform(0, 90, size=sim.n)
+    sim.people.age = np.random.default_rng(1).uniform(0, 90, size=sim.n) # Local generator, so the process-wide RNG state is untouched
 
     # Define a parameter as a function
     def custom_loc(module, sim, uids):
@@ -228,8 +228,7 @@ def test_array(n=n):
     print(f'Uniform sample for uids {uids} returned {draws}')
 
     assert len(draws) == len(uids)
-    for i in range(len(uids)):
-        assert low[i] < draws[i] < low[i] + high[i], 'Invalid value'
+    assert np.all((low < draws) & (draws < low + high)), 'Invalid value'
     return draws
 
 
@@ -252,12 +251,10 @@ def test_repeat_slot():
     print(f'Uniform sample for slots {slots} returned {draws}')
     assert len(draws) == len(slots)
 
-    unique_slots = np.unique(slots)
-    for s in unique_slots:
-        inds = np.where(slots==s)[0]
-        frac, integ = np.modf(draws[inds])
-        assert np.allclose(integ, low[inds]), 'Integral part should match the low parameter'
-        assert np.allclose(frac, frac[0]), 'Same random numbers, so should be same fractional part'
+    frac, integ = np.modf(draws)
+    assert np.allclose(integ, low), 'Integral part should match the low parameter'
+    _, first, inv = np.unique(slots, return_index=True, return_inverse=True) # Compare each draw against the first draw for its slot, in one vectorized pass
+    assert np.allclose(frac, frac[first][inv]), 'Same random numbers, so should be same fractional part'
     return draws
 
 
@@ -31,14 +31,19 @@ class hiv_syph(ss.Connector):
         syph = diseases.syphilis
         hiv = diseases.hiv
         cd4 = self.sim.people.hiv.cd4
-        
+
+        # Compute the CD4 masks once; "hiv" excludes "aids" so each array is
+        # written once with disjoint masks rather than overwriting the overlap
+        aids = cd4 < 200
+        hiv_only = (cd4 < 500) & ~aids
+
         # People with HIV are more likely to acquire syphilis
-        syph.rel_sus[cd4 < 500] = self.pars.rel_sus_syph_hiv
-        syph.rel_sus[cd4 < 200] = self.pars.rel_sus_syph_aids
+        syph.rel_sus[hiv_only] = self.pars.rel_sus_syph_hiv
+        syph.rel_sus[aids] = self.pars.rel_sus_syph_aids
 
         # People with HIV are more likely to transmit syphilis
-        syph.rel_trans[cd4 < 500] = self.pars.rel_trans_syph_hiv
-        syph.rel_trans[cd4 < 200] = self.pars.rel_trans_syph_aids
+        syph.rel_trans[hiv_only] = self.pars.rel_trans_syph_hiv
+        syph.rel_trans[aids] = self.pars.rel_trans_syph_aids
 
         # People with syphilis are more likely to acquire HIV
         hiv.rel_sus[syph.active] = self.pars.rel_sus_hiv_syph